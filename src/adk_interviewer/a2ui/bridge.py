@@ -19,20 +19,66 @@ Architecture:
 
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
 import uuid
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+
+# Optional fast JSON: orjson decodes request bodies and SSE events and renders
+# A2A replies; A2UI payloads from model output stay on stdlib json
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as A2AResponse
+    json_loads = orjson.loads
+except ImportError:
+    A2AResponse = JSONResponse
+    json_loads = json.loads
+
+# Optional shared session store (only used when REDIS_URL is set)
+try:
+    from redis.asyncio import Redis
+    from redis.exceptions import RedisError
+except ImportError:
+    Redis = None
+    RedisError = ()  # Nothing to catch without redis
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="A2A-ADK Bridge", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open one pooled ADK client for the process; close it on shutdown.
+    
+    Reusing keep-alive connections avoids a TCP handshake per A2A turn.
+    """
+    app.state.adk_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(120.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+    app.state.redis = None
+    if REDIS_URL:
+        if Redis is None:
+            logger.warning("REDIS_URL is set but redis is not installed; using in-process sessions")
+        else:
+            app.state.redis = Redis.from_url(REDIS_URL, decode_responses=True)
+    try:
+        yield
+    finally:
+        await app.state.adk_client.aclose()
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+
+
+app = FastAPI(title="A2A-ADK Bridge", version="0.1.0", lifespan=lifespan)
 
 # CORS for A2UI frontend
 app.add_middleware(
@@ -47,10 +93,31 @@ app.add_middleware(
 ADK_BASE_URL = "http://localhost:8000"
 ADK_APP_NAME = "adk_interviewer"
 
+# Cap on in-flight ADK requests; bursts above this queue here instead of
+# hitting Gemini rate limits (429) upstream
+ADK_MAX_CONCURRENCY = int(os.getenv("ADK_MAX_CONCURRENCY", "6"))
+adk_semaphore = asyncio.Semaphore(ADK_MAX_CONCURRENCY)
+
+# Console banner printed when the bridge is started as a module
+STARTUP_BANNER = "\n".join((
+    "=" * 60,
+    "A2A-ADK Bridge Server",
+    "=" * 60,
+    "Bridge:   http://localhost:10002",
+    f"ADK:      {ADK_BASE_URL}",
+    "A2UI:     http://localhost:3000/?app=interviewer",
+    "=" * 60,
+))
+
 # Session storage for conversation persistence (v4.7.1)
 # Maps user_id -> session_id to maintain conversation across turns
 user_sessions: dict[str, str] = {}
 
+# Set REDIS_URL to share sessions across uvicorn workers and survive restarts
+REDIS_URL = os.getenv("REDIS_URL", "")
+SESSION_KEY_PREFIX = "a2ui:sess:"
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "3600"))
+
 # A2A Agent Card (required by A2UI client)
 AGENT_CARD = {
     "name": "AI Technical Interviewer",
@@ -81,12 +148,43 @@ AGENT_CARD = {
     ],
 }
 
+# The card never changes at runtime: serialize it once and let clients cache it
+AGENT_CARD_BYTES = json.dumps(AGENT_CARD, separators=(",", ":")).encode("utf-8")
+AGENT_CARD_ETAG = f'"{hashlib.sha256(AGENT_CARD_BYTES).hexdigest()[:16]}"'
+AGENT_CARD_HEADERS = {
+    "Cache-Control": "public, max-age=300",
+    "ETag": AGENT_CARD_ETAG,
+}
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison).
+    
+    Args:
+        if_none_match: Raw header value, e.g. '"a", W/"b"' or '*'
+        etag: Quoted entity tag of the current representation
+        
+    Returns:
+        True if the client's cached copy is still current
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/")
+        if tag == "*" or tag == etag:
+            return True
+    return False
+
 
 @app.get("/.well-known/agent-card.json")
-async def get_agent_card():
+async def get_agent_card(request: Request):
     """A2A protocol: Agent discovery endpoint."""
     logger.info("Agent card requested")
-    return JSONResponse(content=AGENT_CARD)
+    if etag_matches(request.headers.get("if-none-match", ""), AGENT_CARD_ETAG):
+        return Response(status_code=304, headers=AGENT_CARD_HEADERS)
+    return Response(
+        content=AGENT_CARD_BYTES,
+        media_type="application/json",
+        headers=AGENT_CARD_HEADERS,
+    )
 
 
 @app.post("/")
@@ -97,16 +195,17 @@ async def send_task(request: Request):
     Translates to ADK protocol and returns A2UI-formatted response.
     """
     try:
-        body = await request.json()
-        logger.info(f"Received A2A request: {json.dumps(body, indent=2)[:500]}")
+        body = json_loads(await request.body())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received A2A request: %.500s", json.dumps(body))
         
         # Extract user message from A2A format
         user_message = extract_user_message(body)
-        logger.info(f"Extracted message: {user_message}")
+        logger.info("Extracted message: %s", user_message)
         
         # Forward to ADK backend
         adk_response = await forward_to_adk(user_message)
-        logger.info(f"ADK response: {adk_response[:500] if adk_response else 'None'}")
+        logger.debug("ADK response: %.500s", adk_response)
         
         # Parse A2UI JSON from ADK response
         a2ui_messages = parse_a2ui_from_response(adk_response)
@@ -114,10 +213,10 @@ async def send_task(request: Request):
         # Format as A2A task response
         response = format_a2a_response(body, adk_response, a2ui_messages)
         
-        return JSONResponse(content=response)
+        return A2AResponse(content=response)
         
     except Exception as e:
-        logger.error(f"Error processing request: {e}")
+        logger.exception("Error processing request")
         return JSONResponse(
             status_code=500,
             content={"error": {"code": "internal_error", "message": str(e)}}
@@ -148,148 +247,203 @@ def extract_user_message(body: dict) -> str:
     return ""
 
 
+async def get_or_create_session(user_id: str) -> tuple[str, bool]:
+    """Look up the ADK session for a user, creating one on first use.
+    
+    Uses Redis when configured; if Redis is unreachable the turn falls back
+    to the in-process session map instead of failing.
+    
+    Args:
+        user_id: A2UI user identifier
+        
+    Returns:
+        Tuple of (session_id, is_new_session)
+    """
+    redis_client = app.state.redis
+    if redis_client is not None:
+        try:
+            return await _get_or_create_redis_session(redis_client, user_id)
+        except RedisError as e:
+            logger.warning("Redis session store unavailable, using in-process sessions: %s", e)
+    
+    is_new_session = user_id not in user_sessions
+    if is_new_session:
+        user_sessions[user_id] = str(uuid.uuid4())
+    return user_sessions[user_id], is_new_session
+
+
+async def _get_or_create_redis_session(redis_client, user_id: str) -> tuple[str, bool]:
+    """Redis-backed variant of get_or_create_session."""
+    # SET NX claims the key atomically, so concurrent workers agree on one session
+    key = f"{SESSION_KEY_PREFIX}{user_id}"
+    candidate = str(uuid.uuid4())
+    if await redis_client.set(key, candidate, ex=SESSION_TTL_SECONDS, nx=True):
+        return candidate, True
+    
+    existing = await redis_client.get(key)
+    if existing is None:
+        # Key expired between SET and GET; claim it again
+        return await _get_or_create_redis_session(redis_client, user_id)
+    
+    await redis_client.expire(key, SESSION_TTL_SECONDS)
+    return existing, False
+
+
 async def forward_to_adk(message: str) -> str:
+    """Forward message to ADK backend, throttled by ADK_MAX_CONCURRENCY."""
+    async with adk_semaphore:
+        return await _forward_to_adk(message)
+
+
+async def _forward_to_adk(message: str) -> str:
     """Forward message to ADK backend and get response.
     
     v4.7.1: Sessions are now persistent per user for conversation continuity.
     """
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        user_id = "a2ui_user"
-        
-        # Reuse existing session or create new one (v4.7.1 - conversation persistence)
-        is_new_session = user_id not in user_sessions
-        if is_new_session:
-            user_sessions[user_id] = str(uuid.uuid4())
-        session_id = user_sessions[user_id]
-        
-        logger.info(f"Session: {session_id} ({'new' if is_new_session else 'existing'})")
-        
-        # Step 1: Create session on first message only
-        if is_new_session:
-            session_url = f"{ADK_BASE_URL}/apps/{ADK_APP_NAME}/users/{user_id}/sessions/{session_id}"
-            logger.info(f"Creating session at: {session_url}")
-            
-            try:
-                session_response = await client.post(session_url, json={"state": {}})
-                logger.info(f"Session creation response: {session_response.status_code}")
-            except httpx.HTTPError as e:
-                logger.warning(f"Session creation failed (may not be required): {e}")
-        
-        # Step 2: Send message via run_sse (streaming) endpoint
-        run_url = f"{ADK_BASE_URL}/run_sse"
+    client = app.state.adk_client
+    
+    user_id = "a2ui_user"
+    
+    # Reuse existing session or create new one (v4.7.1 - conversation persistence)
+    session_id, is_new_session = await get_or_create_session(user_id)
+    
+    logger.info("Session: %s (%s)", session_id, "new" if is_new_session else "existing")
+    
+    # Step 1: Create session on first message only
+    if is_new_session:
+        session_url = f"{ADK_BASE_URL}/apps/{ADK_APP_NAME}/users/{user_id}/sessions/{session_id}"
+        logger.info("Creating session at: %s", session_url)
         
-        payload = {
-            "app_name": ADK_APP_NAME,
-            "user_id": user_id,
-            "session_id": session_id,
-            "new_message": {
-                "role": "user",
-                "parts": [{"text": message}]
-            },
-            "streaming": False
-        }
+        try:
+            session_response = await client.post(session_url, json={"state": {}})
+            logger.info("Session creation response: %s", session_response.status_code)
+        except httpx.HTTPError as e:
+            logger.warning("Session creation failed (may not be required): %s", e)
+    
+    # Step 2: Send message via run_sse (streaming) endpoint
+    run_url = f"{ADK_BASE_URL}/run_sse"
+    
+    payload = {
+        "app_name": ADK_APP_NAME,
+        "user_id": user_id,
+        "session_id": session_id,
+        "new_message": {
+            "role": "user",
+            "parts": [{"text": message}]
+        },
+        "streaming": False
+    }
+    
+    logger.info("Forwarding to ADK: %s", run_url)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Payload: %s", json.dumps(payload))
+    
+    try:
+        async with client.stream("POST", run_url, json=payload) as response:
+            if response.status_code != 404:
+                return await _read_adk_response(response)
         
-        logger.info(f"Forwarding to ADK: {run_url}")
-        logger.info(f"Payload: {json.dumps(payload)}")
+        # If run_sse fails, try direct session message endpoint
+        logger.info("run_sse not found, trying session message endpoint")
+        msg_url = f"{ADK_BASE_URL}/apps/{ADK_APP_NAME}/users/{user_id}/sessions/{session_id}"
+        async with client.stream("POST", msg_url, json={"message": message}) as response:
+            return await _read_adk_response(response)
         
-        try:
-            response = await client.post(run_url, json=payload)
-            
-            # If run_sse fails, try direct session message endpoint
-            if response.status_code == 404:
-                logger.info("run_sse not found, trying session message endpoint")
-                msg_url = f"{ADK_BASE_URL}/apps/{ADK_APP_NAME}/users/{user_id}/sessions/{session_id}"
-                response = await client.post(msg_url, json={"message": message})
-            
-            logger.info(f"ADK response status: {response.status_code}")
-            
-            if response.status_code == 404:
-                # Last resort: Check available endpoints
-                return f"ADK endpoint not found. Status: {response.status_code}. Try 'adk api_server src' instead of 'adk web src' for REST API."
-            
-            response.raise_for_status()
-            
-            # Handle SSE response format (text/event-stream)
-            content_type = response.headers.get("content-type", "")
-            if "text/event-stream" in content_type:
-                # Parse SSE events
-                text = response.text
-                logger.info(f"SSE response: {text[:500]}")
-                
-                # Extract JSON data from SSE format
-                full_text = []
-                has_function_call = False
-                for line in text.split('\n'):
-                    if line.startswith('data:'):
-                        try:
-                            data = json.loads(line[5:].strip())
-                            # Check for error response (e.g., 429 quota exceeded)
-                            if "error" in data:
-                                error_info = data.get("error", "Unknown error")
-                                logger.warning(f"ADK returned error: {error_info}")
-                                return f"⚠️ API Error: The service is temporarily unavailable. Please try again in a moment. (Rate limit may have been exceeded)"
-                            if "content" in data:
-                                parts = data["content"].get("parts", [])
-                                for part in parts:
-                                    if "text" in part:
-                                        full_text.append(part["text"])
-                                    elif "functionCall" in part:
-                                        # ADK internal function call (e.g., transfer_to_agent)
-                                        # This is an internal operation, wait for next response
-                                        func_name = part["functionCall"].get("name", "unknown")
-                                        logger.info(f"ADK function call: {func_name}")
-                                        has_function_call = True
-                        except json.JSONDecodeError:
-                            # Handle non-JSON data lines (like error strings)
-                            data_content = line[5:].strip()
-                            if data_content.startswith('"error"') or 'error' in data_content.lower():
-                                logger.warning(f"SSE error line: {data_content[:200]}")
-                                return f"⚠️ Service temporarily unavailable. Please try again."
-                if full_text:
-                    return ''.join(full_text)
-                elif has_function_call:
-                    # Only function call, no text - return processing message
-                    return "Processing your request... (internal routing)"
-                else:
-                    # Empty response from ADK (no text, no function call)
-                    logger.warning("ADK returned empty content response")
-                    return "I'm processing your input. Please continue with your next question."
-
-            # Only reach here if NOT text/event-stream
-
-            logger.info(f"ADK raw response: {json.dumps(data)[:1000] if isinstance(data, (dict, list)) else str(data)[:1000]}")
-            
-            # Extract response text from ADK format
-            if isinstance(data, list):
-                # ADK returns list of events
-                for event in data:
-                    if isinstance(event, dict):
-                        content = event.get("content", {})
-                        parts = content.get("parts", [])
-                        for part in parts:
-                            if isinstance(part, dict) and "text" in part:
-                                return part["text"]
-            elif isinstance(data, dict):
-                # Handle single response
-                if "content" in data:
-                    content = data["content"]
-                    if isinstance(content, dict):
-                        parts = content.get("parts", [])
+    except httpx.HTTPError as e:
+        logger.error("ADK request failed: %s", e)
+        return f"Error connecting to ADK: {e}"
+
+
+async def _read_adk_response(response: httpx.Response) -> str:
+    """Extract reply text from a streamed ADK response.
+    
+    SSE bodies are consumed line by line as they arrive instead of being
+    buffered whole; any other body is read once and parsed as JSON.
+    """
+    logger.info("ADK response status: %s", response.status_code)
+    
+    if response.status_code == 404:
+        # Last resort: Check available endpoints
+        return f"ADK endpoint not found. Status: {response.status_code}. Try 'adk api_server src' instead of 'adk web src' for REST API."
+    
+    response.raise_for_status()
+    
+    # Handle SSE response format (text/event-stream)
+    content_type = response.headers.get("content-type", "")
+    if "text/event-stream" in content_type:
+        # Extract JSON data from SSE format
+        full_text = []
+        has_function_call = False
+        async for line in response.aiter_lines():
+            if line.startswith('data:'):
+                try:
+                    data = json_loads(line[5:].strip())
+                    # Check for error response (e.g., 429 quota exceeded)
+                    if "error" in data:
+                        error_info = data.get("error", "Unknown error")
+                        logger.warning("ADK returned error: %s", error_info)
+                        return f"⚠️ API Error: The service is temporarily unavailable. Please try again in a moment. (Rate limit may have been exceeded)"
+                    if "content" in data:
+                        parts = data["content"].get("parts", [])
                         for part in parts:
-                            if isinstance(part, dict) and "text" in part:
-                                return part["text"]
-                if "response" in data:
-                    return data["response"]
-                if "text" in data:
-                    return data["text"]
-                # Return full JSON if format unknown
-                return json.dumps(data)
-            
-            return str(data)
-            
-        except httpx.HTTPError as e:
-            logger.error(f"ADK request failed: {e}")
-            return f"Error connecting to ADK: {e}"
+                            if "text" in part:
+                                full_text.append(part["text"])
+                            elif "functionCall" in part:
+                                # ADK internal function call (e.g., transfer_to_agent)
+                                # This is an internal operation, wait for next response
+                                func_name = part["functionCall"].get("name", "unknown")
+                                logger.info("ADK function call: %s", func_name)
+                                has_function_call = True
+                except json.JSONDecodeError:
+                    # Handle non-JSON data lines (like error strings)
+                    data_content = line[5:].strip()
+                    if data_content.startswith('"error"') or 'error' in data_content.lower():
+                        logger.warning("SSE error line: %.200s", data_content)
+                        return f"⚠️ Service temporarily unavailable. Please try again."
+        if full_text:
+            return ''.join(full_text)
+        elif has_function_call:
+            # Only function call, no text - return processing message
+            return "Processing your request... (internal routing)"
+        else:
+            # Empty response from ADK (no text, no function call)
+            logger.warning("ADK returned empty content response")
+            return "I'm processing your input. Please continue with your next question."
+
+    # Only reach here if NOT text/event-stream
+    await response.aread()
+    data = response.json()
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("ADK raw response: %.1000s", json.dumps(data))
+    
+    # Extract response text from ADK format
+    if isinstance(data, list):
+        # ADK returns list of events
+        for event in data:
+            if isinstance(event, dict):
+                content = event.get("content", {})
+                parts = content.get("parts", [])
+                for part in parts:
+                    if isinstance(part, dict) and "text" in part:
+                        return part["text"]
+    elif isinstance(data, dict):
+        # Handle single response
+        if "content" in data:
+            content = data["content"]
+            if isinstance(content, dict):
+                parts = content.get("parts", [])
+                for part in parts:
+                    if isinstance(part, dict) and "text" in part:
+                        return part["text"]
+        if "response" in data:
+            return data["response"]
+        if "text" in data:
+            return data["text"]
+        # Return full JSON if format unknown
+        return json.dumps(data)
+    
+    return str(data)
 
 
 def parse_a2ui_from_response(response: str) -> list[dict[str, Any]]:
@@ -298,19 +452,37 @@ def parse_a2ui_from_response(response: str) -> list[dict[str, Any]]:
         return []
     
     try:
-        _, json_part = response.split("---a2ui_JSON---", 1)
-        json_str = json_part.strip()
+        json_str = response.partition("---a2ui_JSON---")[2].strip()
         
         # Clean markdown code blocks
-        if json_str.startswith("```"):
-            json_str = json_str.lstrip("```json").lstrip("```").rstrip("```").strip()
+        json_str = json_str.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
         
         return json.loads(json_str)
     except (ValueError, json.JSONDecodeError) as e:
-        logger.warning(f"Failed to parse A2UI JSON: {e}")
+        logger.warning("Failed to parse A2UI JSON: %s", e)
         return []
 
 
+# Static parts of the fallback text surface; shared read-only by every response
+A2UI_SURFACE_ID = "interview-surface"
+A2UI_BEGIN_RENDERING = {
+    "beginRendering": {
+        "surfaceId": A2UI_SURFACE_ID,
+        "root": "root-container"
+    }
+}
+A2UI_ROOT_CONTAINER = {
+    "id": "root-container",
+    "component": {
+        "Column": {
+            "children": {
+                "explicitList": ["text-response"]
+            }
+        }
+    }
+}
+
+
 def format_a2a_response(
     request: dict, 
     text_response: str, 
@@ -318,7 +490,6 @@ def format_a2a_response(
 ) -> dict:
     """Format response in A2A JSON-RPC format with A2UI extension."""
     task_id = str(uuid.uuid4())
-    surface_id = "interview-surface"
     
     # Build response parts
     parts = []
@@ -343,26 +514,12 @@ def format_a2a_response(
         # 2. Components use "component" key (not componentProperties)
         # 3. Text values need "literalString" wrapper
         a2ui_messages = [
-            {
-                "beginRendering": {
-                    "surfaceId": surface_id,
-                    "root": "root-container"
-                }
-            },
+            A2UI_BEGIN_RENDERING,
             {
                 "surfaceUpdate": {
-                    "surfaceId": surface_id,
+                    "surfaceId": A2UI_SURFACE_ID,
                     "components": [
-                        {
-                            "id": "root-container",
-                            "component": {
-                                "Column": {
-                                    "children": {
-                                        "explicitList": ["text-response"]
-                                    }
-                                }
-                            }
-                        },
+                        A2UI_ROOT_CONTAINER,
                         {
                             "id": "text-response",
                             "component": {
@@ -412,12 +569,6 @@ def format_a2a_response(
 if __name__ == "__main__":
     import uvicorn
     
-    print("=" * 60)
-    print("A2A-ADK Bridge Server")
-    print("=" * 60)
-    print(f"Bridge:   http://localhost:10002")
-    print(f"ADK:      {ADK_BASE_URL}")
-    print(f"A2UI:     http://localhost:3000/?app=interviewer")
-    print("=" * 60)
+    print(STARTUP_BANNER)
     
     uvicorn.run(app, host="0.0.0.0", port=10002)
@@ -7,6 +7,7 @@ Defines the UI components that agents can render:
 - FeedbackPanel: For scoring/feedback
 """
 
+import functools
 import json
 from typing import Any
 
@@ -108,8 +109,12 @@ INTERVIEW_UI_COMPONENTS = {
 }
 
 
+@functools.cache
 def get_a2ui_prompt() -> str:
-    """Generate A2UI prompt instructions for agents."""
+    """Generate A2UI prompt instructions for agents.
+    
+    The components are constant, so the prompt is built once and cached.
+    """
     components_doc = json.dumps(INTERVIEW_UI_COMPONENTS, indent=2)
     
     return f"""
@@ -167,12 +172,10 @@ def validate_a2ui_response(response: str) -> tuple[bool, str, list[dict[str, Any
         return True, "", None  # No A2UI content, valid plain response
     
     try:
-        _, json_part = response.split("---a2ui_JSON---", 1)
-        json_str = json_part.strip()
+        json_str = response.partition("---a2ui_JSON---")[2].strip()
         
         # Clean up markdown code blocks if present
-        if json_str.startswith("```"):
-            json_str = json_str.lstrip("```json").lstrip("```").rstrip("```").strip()
+        json_str = json_str.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
         
         parsed = json.loads(json_str)
         
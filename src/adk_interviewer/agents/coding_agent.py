@@ -116,6 +116,8 @@ When helping debug:
 - Call any functions (you have no tools)
 """
 
+# A2UI prompt suffix, resolved once at import (empty when A2UI is unavailable)
+A2UI_INSTRUCTION = "\n\n" + get_a2ui_prompt() if A2UI_ENABLED else ""
 
 
 def create_coding_agent() -> Agent:
@@ -133,11 +135,6 @@ def create_coding_agent() -> Agent:
     Returns:
         Agent configured for code analysis with optional A2UI responses
     """
-    # Build instruction with optional A2UI prompt
-    full_instruction = CODING_INSTRUCTION
-    if A2UI_ENABLED:
-        full_instruction += "\n\n" + get_a2ui_prompt()
-    
     return Agent(
         model="gemini-2.5-flash-lite",
         name="coding_agent",
@@ -146,6 +143,6 @@ def create_coding_agent() -> Agent:
             "Reviews and analyzes Python code, traces logic, and identifies issues. "
             "Can provide rich UI components for code display."
         ),
-        instruction=full_instruction
+        instruction=CODING_INSTRUCTION + A2UI_INSTRUCTION
     )
 
@@ -128,5 +128,6 @@ def create_communication_scorer(model: str = None) -> Agent:
             "structure, completeness, and professionalism of explanations."
         ),
         instruction=COMMUNICATION_SCORER_INSTRUCTION,
+        output_key="communication_evaluation",  # Read by the score aggregator
         tools=[]  # Pure LLM reasoning
     )
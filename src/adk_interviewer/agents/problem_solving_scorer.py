@@ -129,5 +129,6 @@ def create_problem_solving_scorer(model: str = None) -> Agent:
             "analytical thinking, creativity, and methodology."
         ),
         instruction=PROBLEM_SOLVING_SCORER_INSTRUCTION,
+        output_key="problem_solving_evaluation",  # Read by the score aggregator
         tools=[]  # Pure LLM reasoning
     )
@@ -2,9 +2,11 @@
 Scoring Coordinator Agent for Multi-Agent Scoring System.
 
 Orchestrates parallel evaluation and aggregates scores from specialists.
+The three specialist scorers run concurrently in a ParallelAgent, then a
+single aggregator combines their evaluations.
 """
 
-from google.adk.agents import Agent
+from google.adk.agents import Agent, ParallelAgent, SequentialAgent
 from ..config import config
 from .technical_scorer import create_technical_scorer
 from .communication_scorer import create_communication_scorer
@@ -12,10 +14,10 @@ from .problem_solving_scorer import create_problem_solving_scorer
 
 
 SCORING_COORDINATOR_INSTRUCTION = """
-You are the Scoring Coordinator orchestrating multi-agent evaluation.
+You are the Score Aggregator combining the specialist scorers' evaluations.
 
 ## Your Role
-Coordinate specialist scorers to provide comprehensive candidate assessment.
+Aggregate specialist scorer evaluations into a comprehensive candidate assessment.
 
 ## Specialist Scorers
 
@@ -33,10 +35,21 @@ Coordinate specialist scorers to provide comprehensive candidate assessment.
 
 ## Workflow
 
-1. **Delegate to Specialists**
-   - Send answer to all 3 scorers in parallel
-   - Each provides independent evaluation
-   - No cross-contamination of scores
+1. **Collect Specialist Evaluations**
+   - All 3 scorers have already evaluated the answer in parallel
+   - Each is independent; no cross-contamination of scores
+   - If an evaluation below is empty, that scorer produced no result:
+     mark its dimension as "not evaluated", re-weight the remaining
+     dimensions proportionally, and say so in the final assessment
+
+   Technical evaluation:
+   {technical_evaluation?}
+
+   Communication evaluation:
+   {communication_evaluation?}
+
+   Problem-solving evaluation:
+   {problem_solving_evaluation?}
 
 2. **Aggregate Scores**
    - Collect all specialist scores
@@ -91,34 +104,52 @@ Coordinate specialist scorers to provide comprehensive candidate assessment.
 """
 
 
-def create_scoring_coordinator(model: str = None) -> Agent:
+def create_scoring_coordinator(model: str = None) -> SequentialAgent:
     """
-    Create scoring coordinator agent with specialist sub-agents.
+    Create scoring coordinator with specialist sub-agents.
     
-    Orchestrates parallel evaluation across multiple dimensions:
+    Runs parallel evaluation across multiple dimensions:
     - Technical correctness & code quality
     - Communication & explanation clarity  
     - Problem-solving approach & creativity
     
+    The scorers are independent, so they run concurrently in a
+    ParallelAgent and total latency is that of the slowest scorer
+    rather than the sum of all three. An aggregator agent then
+    combines their evaluations.
+    
     Args:
-        model: Override default model
+        model: Override default model for the aggregator
         
     Returns:
-        Agent: Scoring coordinator with 3 specialist sub-agents
+        SequentialAgent: Parallel specialist scorers followed by the aggregator
     """
-    return Agent(
-        model=model or config.MODEL_NAME,
+    return SequentialAgent(
         name="scoring_coordinator",
         description=(
-            "Multi-agent scoring system coordinator. Orchestrates parallel "
+            "Multi-agent scoring system coordinator. Runs parallel "
             "evaluation across technical, communication, and problem-solving "
             "dimensions. Provides comprehensive candidate assessment."
         ),
-        instruction=SCORING_COORDINATOR_INSTRUCTION,
         sub_agents=[
-            create_technical_scorer(),
-            create_communication_scorer(),
-            create_problem_solving_scorer()
-        ],
-        tools=[]  # Coordination via sub-agents
+            ParallelAgent(
+                name="parallel_scorers",
+                description="Runs the specialist scorers concurrently",
+                sub_agents=[
+                    create_technical_scorer(),
+                    create_communication_scorer(),
+                    create_problem_solving_scorer()
+                ]
+            ),
+            Agent(
+                model=model or config.MODEL_NAME,
+                name="score_aggregator",
+                description=(
+                    "Aggregates specialist scores into a weighted overall "
+                    "assessment and hiring recommendation."
+                ),
+                instruction=SCORING_COORDINATOR_INSTRUCTION,
+                tools=[]  # Pure LLM aggregation
+            )
+        ]
     )
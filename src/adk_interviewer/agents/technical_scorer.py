@@ -127,5 +127,6 @@ def create_technical_scorer(model: str = None) -> Agent:
             "quality, efficiency, and best practices."
         ),
         instruction=TECHNICAL_SCORER_INSTRUCTION,
+        output_key="technical_evaluation",  # Read by the score aggregator
         tools=[]  # Pure LLM reasoning
     )
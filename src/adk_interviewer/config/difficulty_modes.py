@@ -5,7 +5,7 @@ Defines Quick/Standard/Deep interview tracks following NotebookLM pattern.
 """
 
 from enum import Enum
-from typing import Dict, Any
+from typing import Dict
 from dataclasses import dataclass
 
 
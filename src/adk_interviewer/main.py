@@ -34,11 +34,26 @@ try:
     validate_config()
     logger.info("✅ ADK Interviewer configuration validated")
 except ValueError as e:
-    logger.warning(f"⚠️ Configuration issue: {e}")
+    logger.warning("⚠️ Configuration issue: %s", e)
 
 # Export for ADK
 __all__ = ["root_agent"]
 
+# Static part of the CLI banner, built once at import
+USAGE_BANNER = "\n".join((
+    "=" * 60,
+    "🤖 AI Technical Interviewer - Google ADK Version",
+    "=" * 60,
+    "",
+    "To start the web interface:",
+    "  adk web src/adk_interviewer",
+    "",
+    "To run in CLI mode:",
+    "  adk run src/adk_interviewer",
+    "",
+    "Environment:",
+))
+
 
 def main():
     """
@@ -47,17 +62,7 @@ def main():
     Usage:
         python -m adk_interviewer
     """
-    print("=" * 60)
-    print("🤖 AI Technical Interviewer - Google ADK Version")
-    print("=" * 60)
-    print()
-    print("To start the web interface:")
-    print("  adk web src/adk_interviewer")
-    print()
-    print("To run in CLI mode:")
-    print("  adk run src/adk_interviewer")
-    print()
-    print("Environment:")
+    print(USAGE_BANNER)
     print(f"  GOOGLE_API_KEY: {'✅ Set' if os.getenv('GOOGLE_API_KEY') else '❌ Missing'}")
     print()
 
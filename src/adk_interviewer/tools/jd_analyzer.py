@@ -5,7 +5,6 @@ Extracts key requirements and focus areas from job descriptions
 to tailor interview questions appropriately.
 """
 
-from typing import Optional
 import re
 
 
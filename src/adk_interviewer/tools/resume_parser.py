@@ -5,13 +5,20 @@ Extracts relevant information from resume text or uploaded files.
 Supports PDF, DOCX, and plain text formats via ADK artifacts.
 """
 
-from typing import Optional, Any
+from typing import Any
+from itertools import islice
+import functools
+import hashlib
+import io
 import re
 import logging
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Extracted texts kept per extractor, LRU (keyed by SHA-256 of the file bytes)
+DOCUMENT_CACHE_SIZE = 32
+
 
 def parse_resume(resume_text: str, tool_context: Any) -> dict:
     """
@@ -68,7 +75,7 @@ def parse_resume(resume_text: str, tool_context: Any) -> dict:
                         
             except Exception as e:
                 # Fallback to provided text if artifact parsing fails
-                logger.warning(f"Artifact parsing failed: {e}, using provided text")
+                logger.warning("Artifact parsing failed: %s, using provided text", e)
                 pass
     
     if not final_text or len(final_text.strip()) < 10:
@@ -176,10 +183,11 @@ def parse_resume(resume_text: str, tool_context: Any) -> dict:
     ]
     
     for pattern in project_patterns:
-        matches = re.findall(pattern, text_lower)
-        for match in matches[:3]:  # Limit to 3 projects
-            if len(match) > 10 and len(match) < 100:
-                projects.append(match.strip().capitalize())
+        # Stop scanning after the first 3 matches per pattern
+        for match in islice(re.finditer(pattern, text_lower), 3):
+            project = match.group(1)
+            if len(project) > 10 and len(project) < 100:
+                projects.append(project.strip().capitalize())
     
     # Generate summary
     skill_summary = ", ".join(found_skills[:5]) if found_skills else "various technologies"
@@ -199,6 +207,39 @@ def parse_resume(resume_text: str, tool_context: Any) -> dict:
     }
 
 
+def _cached_by_content(extract):
+    """
+    Memoize an artifact text extractor on the SHA-256 of the artifact bytes.
+    
+    Re-parsing the same uploaded resume (e.g. when a turn is retried) then
+    skips PDF/DOCX decoding. Least recently used entries are evicted first.
+    """
+    cache: dict[str, str] = {}
+    
+    @functools.wraps(extract)
+    def wrapper(artifact) -> str:
+        data = getattr(artifact, 'data', b'')
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        elif not isinstance(data, (bytes, bytearray, memoryview)):
+            # Not hashable as bytes; let the extractor's own fallback handle it
+            return extract(artifact)
+        
+        key = hashlib.sha256(data).hexdigest()
+        # Pop and re-insert so the dict stays in least-recently-used order
+        text = cache.pop(key, None)
+        if text is None:
+            text = extract(artifact)
+            if len(cache) >= DOCUMENT_CACHE_SIZE:
+                # Concurrent calls may race to evict the same oldest key
+                cache.pop(next(iter(cache)), None)
+        cache[key] = text
+        return text
+    
+    return wrapper
+
+
+@_cached_by_content
 def _extract_text_from_pdf_artifact(artifact) -> str:
     """
     Extract text from PDF artifact.
@@ -207,7 +248,6 @@ def _extract_text_from_pdf_artifact(artifact) -> str:
     """
     try:
         import PyPDF2
-        import io
         
         # Get binary data from artifact
         pdf_data = artifact.data if hasattr(artifact, 'data') else b''
@@ -218,9 +258,7 @@ def _extract_text_from_pdf_artifact(artifact) -> str:
         pdf_file = io.BytesIO(pdf_data)
         pdf_reader = PyPDF2.PdfReader(pdf_file)
         
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
+        text = "\n".join(page.extract_text() for page in pdf_reader.pages)
         
         return text.strip()
         
@@ -232,10 +270,11 @@ def _extract_text_from_pdf_artifact(artifact) -> str:
             return data.decode('utf-8', errors='ignore')
         return str(data)
     except Exception as e:
-        logger.error(f"PDF extraction failed: {e}")
+        logger.error("PDF extraction failed: %s", e)
         return ""
 
 
+@_cached_by_content
 def _extract_text_from_docx_artifact(artifact) -> str:
     """
     Extract text from DOCX artifact.
@@ -244,7 +283,6 @@ def _extract_text_from_docx_artifact(artifact) -> str:
     """
     try:
         import docx
-        import io
         
         # Get binary data from artifact
         docx_data = artifact.data if hasattr(artifact, 'data') else b''
@@ -255,9 +293,7 @@ def _extract_text_from_docx_artifact(artifact) -> str:
         doc_file = io.BytesIO(docx_data)
         doc = docx.Document(doc_file)
         
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
+        text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
         
         return text.strip()
         
@@ -269,5 +305,5 @@ def _extract_text_from_docx_artifact(artifact) -> str:
             return data.decode('utf-8', errors='ignore')
         return str(data)
     except Exception as e:
-        logger.error(f"DOCX extraction failed: {e}")
+        logger.error("DOCX extraction failed: %s", e)
         return ""
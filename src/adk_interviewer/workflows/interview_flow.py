@@ -7,7 +7,6 @@ SequentialAgent and LoopAgent for structured execution.
 
 from google.adk.agents import Agent, SequentialAgent, LoopAgent
 from ..config import config
-from ..agents import create_interviewer_agent, create_critic_agent, create_safety_agent
 
 
 def create_greeter_agent() -> Agent: